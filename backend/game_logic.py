@@ -0,0 +1,213 @@
+from fastapi import WebSocket, WebSocketDisconnect
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Dict, List, Optional
+import asyncio
+import random
+import orjson
+from websockets.exceptions import ConnectionClosed
+
+# ---------------------- ENUM & MODELS ----------------------
+
+class GamePhase(Enum):
+    WAITING = "waiting"
+    BETTING = "betting"
+    REVEAL = "reveal"
+    FINISHED = "finished"
+
+class PlayerStatus(Enum):
+    WAITING = "waiting"
+    PLAYING = "playing"
+    FOLDED = "folded"
+    ALL_IN = "all-in"
+
+# 직렬화 때마다 Enum.value 디스크립터를 거치지 않도록 문자열을 미리 뽑아 둠
+PHASE_STR = {p: p.value for p in GamePhase}
+STATUS_STR = {s: s.value for s in PlayerStatus}
+
+@dataclass(frozen=True, slots=True)
+class Card:
+    month: int
+    type: str
+    name: str
+    value: int
+
+@dataclass(slots=True)
+class Player:
+    id: str
+    name: str
+    chips: int
+    current_bet: int
+    cards: List[Card]
+    hand_value: int
+    hand_name: str
+    status: PlayerStatus
+    is_ready: bool
+    websocket: Optional[WebSocket] = None
+    # 브로드캐스트용으로 미리 만들어 둔 dict, 필드를 바꿀 때 같이 갱신해야 함
+    _wire: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._wire = {
+            "id": self.id,
+            "name": self.name,
+            "chips": self.chips,
+            "currentBet": self.current_bet,
+            "cards": self.cards,
+            "handValue": self.hand_value,
+            "handName": self.hand_name,
+            "status": STATUS_STR[self.status],
+            "isReady": self.is_ready
+        }
+
+@dataclass(slots=True)
+class GameState:
+    id: str
+    players: List[Player]
+    current_player: int
+    phase: GamePhase
+    pot: int
+    min_bet: int
+    max_bet: int
+    round: int
+    winner: Optional[str] = None
+    players_by_id: Dict[str, Player] = field(default_factory=dict)
+
+# ---------------------- GLOBALS ----------------------
+
+games: Dict[str, GameState] = {}
+player_to_room: Dict[str, str] = {}
+
+# TODO: 임시값 - 시작 칩은 아직 정해진 게임 규칙이 없음, 기획 확정 후 교체
+STARTING_CHIPS = 10000
+
+# ---------------------- 카드 정의 ----------------------
+
+SEOTTA_CARDS = [
+    Card(1, "bright", "송학", 20), Card(1, "ribbon", "송파", 5), Card(1, "junk", "송클", 1),
+    Card(2, "animal", "매조", 10), Card(2, "ribbon", "매파", 5), Card(2, "junk", "매클", 1),
+    Card(3, "bright", "뱃광", 20), Card(3, "ribbon", "뱃파", 5), Card(3, "junk", "뱃클", 1),
+    Card(4, "animal", "등사", 10), Card(4, "ribbon", "등파", 5), Card(4, "junk", "등클", 1),
+    Card(5, "animal", "창다리", 10), Card(5, "ribbon", "창파", 5), Card(5, "junk", "창클", 1),
+    Card(6, "animal", "모란나비", 10), Card(6, "ribbon", "모란파", 5), Card(6, "junk", "모란클", 1),
+    Card(7, "animal", "사리머드", 10), Card(7, "ribbon", "사리파", 5), Card(7, "junk", "사리클", 1),
+    Card(8, "bright", "엉사달", 20), Card(8, "animal", "엉기러기", 10), Card(8, "junk", "엉클", 1),
+    Card(9, "animal", "국화술잔", 10), Card(9, "ribbon", "국화파", 5), Card(9, "junk", "국화클", 1),
+    Card(10, "animal", "단풍사승", 10), Card(10, "ribbon", "단풍파", 5), Card(10, "junk", "단풍클", 1),
+    Card(11, "bright", "오동광", 20), Card(11, "junk", "오동클1", 1), Card(11, "junk", "오동클2", 1),
+    Card(12, "bright", "비광", 20), Card(12, "animal", "비제비", 10), Card(12, "junk", "비클", 1)
+]
+SEOTTA_CARDS_T = tuple(SEOTTA_CARDS)
+
+# ---------------------- GAME LOGIC ----------------------
+
+SPECIAL_HANDS = {(1, 2): 100, (1, 4): 99, (1, 9): 98, (1, 10): 97, (4, 10): 96, (4, 6): 95}
+SPECIAL_NAMES = {(a, b): f"{a}{b}땡" for x, y in SPECIAL_HANDS for a, b in ((x, y), (y, x))}
+MONTH_NAMES = {m: f"{m}땡" for m in range(1, 13)}
+TOTAL_NAMES = ("망통", "1끗", "2끗", "3끗", "4끗", "5끗", "6끗", "7끗", "8끗", "9끗")
+
+def _compute_hand_value(m1: int, m2: int) -> tuple[int, str]:
+    if (m1, m2) in SPECIAL_NAMES:
+        return SPECIAL_HANDS.get((m1, m2), SPECIAL_HANDS.get((m2, m1))), SPECIAL_NAMES[(m1, m2)]
+
+    if m1 == m2:
+        return 90 + m1, MONTH_NAMES[m1]
+
+    total = (m1 + m2) % 10
+    return total, TOTAL_NAMES[total]
+
+# 월(1~12) 조합이 144가지뿐이라 족보를 미리 계산해 둠: HAND_TABLE[m1][m2] -> (값, 이름)
+HAND_TABLE: List[List[Optional[tuple[int, str]]]] = [[None] * 13] + [
+    [None] + [_compute_hand_value(m1, m2) for m2 in range(1, 13)] for m1 in range(1, 13)
+]
+
+def calculate_hand_value(cards: List[Card]) -> tuple[int, str]:
+    if len(cards) != 2:
+        return 0, "없음"
+    return HAND_TABLE[cards[0].month][cards[1].month]
+
+# 덱에서 무작위로 count장을 뽑음 (덱보다 많이 요청하면 덱 전체를 섞어서 돌려줌)
+def draw_cards(count: int) -> List[Card]:
+    return random.sample(SEOTTA_CARDS_T, min(count, len(SEOTTA_CARDS_T)))
+
+def deal_cards(game: GameState):
+    # 인원이 덱 크기를 넘으면 뒷자리 플레이어는 카드가 모자라게 받음 (기존 동작과 같음)
+    deck = draw_cards(2 * len(game.players))
+    for i, player in enumerate(game.players):
+        player.cards = deck[i*2:i*2+2]
+        player.hand_value, player.hand_name = calculate_hand_value(player.cards)
+        player._wire["cards"] = player.cards
+        player._wire["handValue"] = player.hand_value
+        player._wire["handName"] = player.hand_name
+
+async def broadcast_game_state(game: GameState):
+    game_data = {
+        "type": "game_state",
+        "data": {
+            "id": game.id,
+            "players": [p._wire for p in game.players],
+            "currentPlayer": game.current_player,
+            "phase": PHASE_STR[game.phase],
+            "pot": game.pot,
+            "minBet": game.min_bet,
+            "maxBet": game.max_bet,
+            "round": game.round,
+            "winner": game.winner
+        }
+    }
+    # orjson은 dataclass(Card)를 직접 직렬화하므로 asdict가 필요 없음
+    payload = orjson.dumps(game_data).decode()
+    targets = [p for p in game.players if p.websocket]
+    results = await asyncio.gather(
+        *(p.websocket.send_text(payload) for p in targets),
+        return_exceptions=True
+    )
+    dead = []
+    error: Optional[BaseException] = None
+    for p, result in zip(targets, results):
+        if isinstance(result, (WebSocketDisconnect, ConnectionClosed, RuntimeError)):
+            # 연결이 끊긴 플레이어는 방에서 정리
+            dead.append(p)
+        elif isinstance(result, BaseException) and error is None:
+            error = result
+    for p in dead:
+        p.websocket = None
+        remove_player(game, p.id)
+    # 예상 못한 오류는 정리를 끝낸 뒤에 다시 올림
+    if error is not None:
+        raise error
+
+def start_new_round(game: GameState):
+    game.phase = GamePhase.BETTING
+    game.current_player = 0
+    game.pot = 0
+    for p in game.players:
+        p.status = PlayerStatus.PLAYING
+        p.current_bet = 0
+        p.is_ready = False
+        p._wire["status"] = STATUS_STR[p.status]
+        p._wire["currentBet"] = 0
+        p._wire["isReady"] = False
+    deal_cards(game)
+
+# 플레이어 목록과 id 인덱스는 항상 이 두 함수로만 같이 바꿀 것
+def add_player(game: GameState, player: Player):
+    game.players.append(player)
+    game.players_by_id[player.id] = player
+    player_to_room[player.id] = game.id
+
+def remove_player(game: GameState, player_id: str) -> Optional[Player]:
+    player = game.players_by_id.pop(player_id, None)
+    if player:
+        index = game.players.index(player)
+        del game.players[index]
+        # 앞자리 플레이어가 빠지면 차례를 한 칸 당기고, 범위를 벗어나면 처음으로
+        if index < game.current_player:
+            game.current_player -= 1
+        if game.current_player >= len(game.players):
+            game.current_player = 0
+        # 마지막 플레이어가 나가면 방 상태도 메모리에서 정리
+        if not game.players:
+            games.pop(game.id, None)
+    player_to_room.pop(player_id, None)
+    return player